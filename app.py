@@ -1,20 +1,63 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-from collections import Counter
+import io
 
 from resonanceX.utils import load_exoplanet_data
-from resonanceX.detector import detect_resonances_in_system
+from resonanceX.detector import detect_resonances_in_system, periods_by_system
 from resonanceX.simulator import simulate_orbits
 from resonanceX.resonance import detect_resonances
-from resonanceX.visualizer import create_orbit_animation, plot_resonances
+from resonanceX.visualizer import create_orbit_animation, plot_resonances_plotly
 from resonanceX.trappist_sim import simulate_trappist1, animate_simulation
 
 st.set_page_config(page_title="resonanceX", layout="wide")
 st.title("resonanceX: Exoplanet Resonance Explorer")
 
+
+# Cached data helpers: Streamlit reruns the whole script on every widget
+# interaction, so the CSV load and dataset-wide aggregates are memoized.
+@st.cache_data
+def _load(path, upload_bytes=None):
+    source = io.BytesIO(upload_bytes) if upload_bytes is not None else path
+    return load_exoplanet_data(source)
+
+
+@st.cache_data
+def _summary(df):
+    return len(df), df['hostname'].nunique(), df['discoverymethod'].nunique()
+
+
+@st.cache_data
+def _method_counts(df):
+    return df['discoverymethod'].value_counts()
+
+
+@st.cache_data
+def _year_counts(df):
+    return df['disc_year'].value_counts().sort_index()
+
+
+@st.cache_data
+def _periods_by_system(df):
+    return periods_by_system(df)
+
+
+@st.cache_data
+def _valid_systems(df):
+    # Keys follow the sorted hostname categories, so no re-sort is needed.
+    return [system for system, periods in _periods_by_system(df).items() if len(periods) >= 2]
+
+
+@st.cache_data(show_spinner=False)
+def _trappist1():
+    return simulate_trappist1()
+
+
+@st.cache_resource
+def _plot_resonances(pairs):
+    return plot_resonances_plotly(pairs)
+
+
 # Sidebar controls
 st.sidebar.header("Configuration")
 csv_path = st.sidebar.text_input("CSV Path", "datasets/nasa_exoplanets.csv")
@@ -23,7 +66,7 @@ uploaded_file = st.sidebar.file_uploader("Upload your own CSV", type="csv")
 
 # Load data
 try:
-    df = pd.read_csv(uploaded_file) if uploaded_file else load_exoplanet_data(csv_path)
+    df = _load(csv_path, uploaded_file.getvalue() if uploaded_file else None)
 except Exception as e:
     st.error(f"Failed to load dataset: {e}")
     st.stop()
@@ -46,9 +89,10 @@ with tab1:
 
 with tab2:
     st.subheader("Dataset Summary")
-    st.metric("Total Planets", len(df))
-    st.metric("Total Systems", df['hostname'].nunique())
-    st.metric("Discovery Methods", df['discoverymethod'].nunique())
+    n_planets, n_systems, n_methods = _summary(df)
+    st.metric("Total Planets", n_planets)
+    st.metric("Total Systems", n_systems)
+    st.metric("Discovery Methods", n_methods)
     with st.expander("Preview Dataset"):
         st.dataframe(df[['hostname', 'pl_letter', 'pl_orbper', 'discoverymethod']].head(20))
 
@@ -56,21 +100,22 @@ with tab3:
     st.subheader("Resonance Detection")
     if st.button("Run Resonance Analysis"):
         try:
-            results = detect_resonances_in_system(df, tolerance)
-            st.success(f"{len(results)} resonance pairs found in {len(set(r[0] for r in results))} systems.")
+            results = detect_resonances_in_system(_periods_by_system(df), tolerance)
+            system_counts = results['system'].value_counts()
+            st.success(f"{len(results)} resonance pairs found in {len(system_counts)} systems.")
 
-            top_systems = Counter([r[0] for r in results]).most_common(5)
             st.markdown("Most Resonant Systems")
-            for system, count in top_systems:
+            for system, count in system_counts.head(5).items():
                 st.write(f"{system}: {count} pairs")
 
             with st.expander("Resonance Pairs"):
-                for system, p1, p2, ratio in results:
-                    st.write(f"{system}: {p1:.2f} vs {p2:.2f} ~ {ratio}:1")
+                st.dataframe(results, hide_index=True, column_config={
+                    col: st.column_config.NumberColumn(format="%.2f") for col in ('p1', 'p2', 'ratio')
+                })
 
-            if results:
-                fig = plot_resonances([(p1, p2, ratio) for _, p1, p2, ratio in results])
-                st.pyplot(fig)
+            if not results.empty:
+                fig = _plot_resonances(results[['p1', 'p2', 'ratio']].to_numpy(dtype=np.float64))
+                st.plotly_chart(fig)
             else:
                 st.warning("No resonances detected.")
         except Exception as e:
@@ -79,25 +124,23 @@ with tab3:
 with tab4:
     st.subheader("Discovery Insights")
     if 'discoverymethod' in df.columns:
-        method_counts = df['discoverymethod'].value_counts()
+        method_counts = _method_counts(df)
         st.write("Discovery Methods")
         st.bar_chart(method_counts)
     if 'disc_year' in df.columns:
-        year_counts = df['disc_year'].value_counts().sort_index()
+        year_counts = _year_counts(df)
         st.write("Discoveries Over Time")
         st.line_chart(year_counts)
 
 with tab5:
     st.subheader("N-Body Simulation Demo")
 
-    valid_systems = df.groupby('hostname').filter(
-        lambda x: x['pl_orbper'].dropna().shape[0] >= 2
-    )['hostname'].unique()
+    valid_systems = _valid_systems(df)
 
     if len(valid_systems) == 0:
         st.warning("No systems with enough orbital period data available.")
     else:
-        selected_system = st.selectbox("Choose a system", sorted(valid_systems))
+        selected_system = st.selectbox("Choose a system", valid_systems)
         system_planets = df[(df['hostname'] == selected_system) & df['pl_orbper'].notna()]
         available_planets = system_planets['pl_letter'].tolist()
 
@@ -116,13 +159,13 @@ with tab5:
             st.warning("Please select at least two planets to run the simulation.")
         else:
             filtered_planets = system_planets[system_planets['pl_letter'].isin(selected_planets)]
-            periods = filtered_planets['pl_orbper'].tolist()
+            periods = filtered_planets['pl_orbper'].to_numpy(dtype=np.float64, copy=False)
 
             if 'pl_bmassj' in filtered_planets.columns:
-                masses = filtered_planets['pl_bmassj'].fillna(0.001).tolist()
-                masses = [m * 0.0009543 if m > 0 else 0.001 for m in masses]
+                masses = filtered_planets['pl_bmassj'].fillna(0.001).to_numpy(dtype=np.float64)
+                masses = np.where(masses > 0, masses * 0.0009543, 0.001)
             else:
-                masses = [0.001] * len(periods)
+                masses = np.full(len(periods), 0.001)
 
             st.write(f"Simulating {len(periods)} planets in {selected_system}: {', '.join(selected_planets)}")
 
@@ -133,7 +176,7 @@ with tab5:
                 try:
                     positions = simulate_orbits(periods, masses, duration, steps, use_resonant_chain=use_resonance)
 
-                    if not positions or not isinstance(positions, list):
+                    if not isinstance(positions, np.ndarray) or positions.size == 0:
                         st.error("Simulation returned no data.")
                     else:
                         st.write("Sample orbit data:", positions[0][:5])
@@ -153,8 +196,8 @@ with tab5:
                             resonance_pairs = detect_resonances(periods)
                             if resonance_pairs:
                                 with st.expander("View Resonance Plot"):
-                                    fig_resonance = plot_resonances(resonance_pairs)
-                                    st.pyplot(fig_resonance)
+                                    fig_resonance = _plot_resonances(np.asarray(resonance_pairs, dtype=np.float64))
+                                    st.plotly_chart(fig_resonance)
                             else:
                                 st.warning("No resonance pairs found.")
 
@@ -167,7 +210,7 @@ with tab6:
     st.subheader("TRAPPIST-1 Orbital Simulator")
     if st.button("Run TRAPPIST-1 Simulation"):
         with st.spinner("Simulating orbital dynamics..."):
-            sol, masses, periods = simulate_trappist1()
+            sol, masses, periods = _trappist1()
             animate_simulation(sol, masses, periods)
 
 with tab7:
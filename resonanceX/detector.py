@@ -1,20 +1,132 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+# Small-integer period ratios p:q tested for resonance. A pair matches when
+# |p2*q - p1*p| / q < tolerance*p1, i.e. |p2/p1 - p/q| < tolerance, without
+# forming p2/p1; RESONANCE_RATIOS holds the p/q values reported for hits.
+RESONANCE_NUM = np.array([2, 3, 4, 5, 5, 3], dtype=np.int64)
+RESONANCE_DEN = np.array([1, 2, 3, 4, 3, 1], dtype=np.int64)
+RESONANCE_RATIOS = RESONANCE_NUM / RESONANCE_DEN
+
+
+@njit(cache=True)
+def _match_ratio(p1, p2, num, den, tolerance):
+    """Index of the ratio p:q nearest to p2/p1 within tolerance, or -1."""
+    best = -1
+    if p1 <= 0.0:
+        return best
+    best_err = tolerance * p1
+    for k in range(num.shape[0]):
+        # |p2*q - p1*p| / q == p1 * |p2/p1 - p/q|
+        err = abs(p2 * den[k] - p1 * num[k]) / den[k]
+        if err < best_err:
+            best = k
+            best_err = err
+    return best
+
+
+@njit(nogil=True, cache=True)
+def _systems_kernel(periods, offsets, num, den, ratios, tolerance):
+    # periods is a flat CSR-style array: system s owns periods[offsets[s]:offsets[s + 1]].
+    n_systems = offsets.shape[0] - 1
+    n_pairs = 0
+    for s in range(n_systems):
+        k = offsets[s + 1] - offsets[s]
+        n_pairs += k * (k - 1) // 2
+
+    out = np.empty((n_pairs, 3))
+    owner = np.empty(n_pairs, dtype=np.int64)
+    count = 0
+    for s in range(n_systems):
+        for i in range(offsets[s], offsets[s + 1]):
+            for j in range(i + 1, offsets[s + 1]):
+                best = _match_ratio(periods[i], periods[j], num, den, tolerance)
+                if best >= 0:
+                    out[count, 0] = periods[i]
+                    out[count, 1] = periods[j]
+                    out[count, 2] = ratios[best]
+                    owner[count] = s
+                    count += 1
+    return out[:count], owner[:count]
+
+
 def detect_resonances(periods, tolerance=0.05):
-    resonant_pairs = []
-    for i in range(len(periods)):
-        for j in range(i + 1, len(periods)):
-            ratio = periods[i] / periods[j]
-            if abs(ratio - round(ratio)) < tolerance:
-                resonant_pairs.append((periods[i], periods[j], round(ratio)))
-    return resonant_pairs
-
-def detect_resonances_in_system(df, tolerance=0.05):
-    results = []
-    for system in df['hostname'].unique():
-        planets = df[df['hostname'] == system]
-        periods = planets['pl_orbper'].dropna().tolist()
-        for i in range(len(periods)):
-            for j in range(i + 1, len(periods)):
-                ratio = periods[i] / periods[j]
-                if abs(ratio - round(ratio)) < tolerance:
-                    results.append((system, periods[i], periods[j], round(ratio)))
-    return results
\ No newline at end of file
+    """
+    Detects near small-integer resonances between every pair of planet periods.
+
+    Args:
+        periods (array-like of float): Orbital periods in days.
+        tolerance (float): Allowed absolute deviation of p2/p1 from the resonant ratio.
+
+    Returns:
+        numpy.ndarray: Array of shape (n_pairs, 3) with rows (p1, p2, ratio),
+            where p1 < p2 and ratio is the matched entry of RESONANCE_RATIOS.
+    """
+    periods = np.sort(np.asarray(periods, dtype=np.float64))
+    offsets = np.array([0, len(periods)], dtype=np.int64)
+    pairs, _ = _systems_kernel(periods, offsets, RESONANCE_NUM, RESONANCE_DEN, RESONANCE_RATIOS, tolerance)
+    return pairs
+
+
+def periods_by_system(df):
+    """
+    Groups orbital periods by host star.
+
+    Args:
+        df (pandas.DataFrame): Planet table with 'hostname' and 'pl_orbper' columns.
+
+    Returns:
+        dict: Maps each hostname to a sorted float64 array of its positive periods.
+    """
+    planets = df[df['pl_orbper'] > 0].sort_values(['hostname', 'pl_orbper'])
+    return {system: periods.to_numpy(dtype=np.float64)
+            for system, periods in planets.groupby('hostname', observed=True)['pl_orbper']}
+
+
+def detect_resonances_in_system(systems, tolerance=0.05, n_jobs=None):
+    """
+    Detects near small-integer resonances between planet pairs within each system.
+
+    Args:
+        systems (dict or pandas.DataFrame): Mapping of hostname to orbital periods
+            in days, as returned by periods_by_system, or a planet table with
+            'hostname' and 'pl_orbper' columns.
+        tolerance (float): Allowed absolute deviation of p2/p1 from the resonant ratio.
+        n_jobs (int, optional): Number of threads used to scan systems. None or
+            a value <= 0 uses all available cores.
+
+    Returns:
+        pandas.DataFrame: One row per resonant pair with columns 'system',
+            'p1', 'p2' and 'ratio', where p1 < p2 and ratio is the matched
+            entry of RESONANCE_RATIOS.
+    """
+    if isinstance(systems, pd.DataFrame):
+        systems = periods_by_system(systems)
+    if not systems:
+        return pd.DataFrame(columns=['system', 'p1', 'p2', 'ratio'])
+    names = np.array(list(systems.keys()), dtype=object)
+    arrays = [np.sort(np.asarray(p, dtype=np.float64)) for p in systems.values()]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([len(p) for p in arrays], out=offsets[1:])
+    flat = np.concatenate(arrays)
+
+    # Systems are independent, so contiguous blocks holding roughly equal numbers
+    # of periods are scanned in parallel threads; the kernel releases the GIL.
+    if n_jobs is None or n_jobs <= 0:
+        n_jobs = os.cpu_count() or 1
+    cuts = np.searchsorted(offsets, np.linspace(0, offsets[-1], n_jobs + 1)[1:-1])
+    bounds = np.unique(np.concatenate([[0], cuts, [len(arrays)]]))
+
+    def scan(start, stop):
+        pairs, owner = _systems_kernel(flat, offsets[start:stop + 1], RESONANCE_NUM, RESONANCE_DEN,
+                                       RESONANCE_RATIOS, tolerance)
+        return pairs, owner + start
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        chunks = list(pool.map(scan, bounds[:-1], bounds[1:]))
+    pairs, owner = (np.concatenate(cols) for cols in zip(*chunks))
+    return pd.DataFrame({'system': names[owner], 'p1': pairs[:, 0], 'p2': pairs[:, 1], 'ratio': pairs[:, 2]})
@@ -6,22 +6,25 @@ def simulate_orbits(periods, masses, duration=100, steps=1000, use_resonant_chai
     Simulates planetary orbits using REBOUND with mutual interactions and optional resonant chain setup.
 
     Args:
-        periods (list of float): Orbital periods in days.
-        masses (list of float): Planet masses in solar masses.
+        periods (array-like of float): Orbital periods in days.
+        masses (array-like of float): Planet masses in solar masses.
         duration (float): Total simulation time in days.
         steps (int): Number of time steps.
         use_resonant_chain (bool): If True, adjusts periods to form a resonant chain.
 
     Returns:
-        list of list of (x, y) tuples: Trajectories for each planet.
+        numpy.ndarray: Array of shape (n_planets, steps, 2) holding the (x, y)
+            trajectory of each planet.
     """
     try:
         # Validate inputs
-        if not periods or not masses:
-            raise ValueError("Periods and masses must be non-empty lists.")
+        periods = np.asarray(periods, dtype=np.float64)
+        masses = np.asarray(masses, dtype=np.float64)
+        if periods.size == 0 or masses.size == 0:
+            raise ValueError("Periods and masses must be non-empty.")
         if len(periods) != len(masses):
             raise ValueError("Periods and masses must be the same length.")
-        if any(p <= 0 for p in periods):
+        if np.any(periods <= 0):
             raise ValueError("All orbital periods must be positive.")
         if steps <= 0 or duration <= 0:
             raise ValueError("Duration and steps must be positive.")
@@ -35,11 +38,7 @@ def simulate_orbits(periods, masses, duration=100, steps=1000, use_resonant_chai
 
         # Optional: adjust periods to form a resonant chain (e.g., 3:2, 4:3, etc.)
         if use_resonant_chain:
-            base_period = periods[0]
-            ratios = [1.0]
-            for i in range(1, len(periods)):
-                ratios.append(ratios[-1] * (3/2))  # 3:2 resonance chain
-            periods = [base_period * r for r in ratios]
+            periods = periods[0] * (3/2) ** np.arange(len(periods))  # 3:2 resonance chain
 
         # Add planets with realistic orbital parameters
         for i in range(len(periods)):
@@ -54,15 +53,18 @@ def simulate_orbits(periods, masses, duration=100, steps=1000, use_resonant_chai
         sim.move_to_com()
 
         times = np.linspace(0, duration, steps)
-        trajectories = [[] for _ in range(len(periods))]
+        # Structure-of-arrays buffers: REBOUND copies particle coordinates
+        # into xyz on the C side, so the loop never touches Particle objects.
+        xyz = np.empty((sim.N, 3))
+        trajectories = np.empty((len(periods), steps, 2))
 
-        for t in times:
+        for k, t in enumerate(times):
             sim.integrate(t)
-            for i, p in enumerate(sim.particles[1:]):
-                trajectories[i].append((p.x, p.y))
+            sim.serialize_particle_data(xyz=xyz)
+            trajectories[:, k] = xyz[1:, :2]
 
         return trajectories
 
     except Exception as e:
         print(f"[simulate_orbits] Error: {e}")
-        return [[] for _ in range(len(periods))]
\ No newline at end of file
+        return np.empty((len(periods), 0, 2))
\ No newline at end of file
@@ -1,9 +1,69 @@
 import unittest
 from resonanceX import detector
+import numpy as np
 import pandas as pd
 
 class TestDetector(unittest.TestCase):
     def test_detect_resonances(self):
         periods = [1.0, 2.0, 3.0, 4.5]
         result = detector.detect_resonances(periods)
-        self.assertTrue(any(r[2] == 2 for r in result))
\ No newline at end of file
+        self.assertTrue(any(r[2] == 2 for r in result))
+
+    def test_detect_resonances_returns_pair_array(self):
+        result = detector.detect_resonances([3.0, 1.0, 2.0])
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, (3, 3))
+        self.assertEqual(result.tolist(), [[1.0, 2.0, 2.0], [1.0, 3.0, 3.0], [2.0, 3.0, 1.5]])
+
+    def test_detect_resonances_ratio_table(self):
+        np.testing.assert_allclose(detector.detect_resonances([1.0, 1.5])[:, 2], [1.5])
+        np.testing.assert_allclose(detector.detect_resonances([3.0, 4.0])[:, 2], [4 / 3])
+        self.assertEqual(detector.detect_resonances([1.0, 1.2], tolerance=0.05).shape, (0, 3))
+        self.assertEqual(detector.detect_resonances([1.0]).shape, (0, 3))
+
+    def test_detect_resonances_in_system_dataframe(self):
+        df = pd.DataFrame({
+            'hostname': ['A', 'A', 'B', 'B', 'C'],
+            'pl_orbper': [2.0, 1.0, 1.0, 1.2, 5.0],
+        })
+        result = detector.detect_resonances_in_system(df)
+        self.assertIsInstance(result, pd.DataFrame)
+        self.assertEqual(list(result.columns), ['system', 'p1', 'p2', 'ratio'])
+        self.assertEqual(result.values.tolist(), [['A', 1.0, 2.0, 2.0]])
+
+    def test_periods_by_system(self):
+        df = pd.DataFrame({
+            'hostname': pd.Categorical(['Kepler-2', 'Alpha', 'Kepler-2', 'Alpha', 'Zeta', 'Kepler-2']),
+            'pl_orbper': [9.0, 4.0, 3.0, 0.0, -1.0, 6.0],
+        })
+        result = detector.periods_by_system(df)
+        self.assertEqual(list(result), ['Alpha', 'Kepler-2'])
+        np.testing.assert_array_equal(result['Alpha'], [4.0])
+        np.testing.assert_array_equal(result['Kepler-2'], [3.0, 6.0, 9.0])
+        self.assertEqual(result['Kepler-2'].dtype, np.float64)
+
+    def test_detect_resonances_in_system_n_jobs(self):
+        systems = {f"star{i}": np.array([1.0, 2.0, 3.0, 4.5]) * (i + 1) for i in range(5)}
+        expected = detector.detect_resonances_in_system(systems, n_jobs=1)
+        self.assertEqual(len(expected), 5 * 4)
+        for n_jobs in (2, 3, len(systems) + 10, -1):
+            result = detector.detect_resonances_in_system(systems, n_jobs=n_jobs)
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_detect_resonances_in_system_empty(self):
+        result = detector.detect_resonances_in_system({})
+        self.assertTrue(result.empty)
+        self.assertEqual(list(result.columns), ['system', 'p1', 'p2', 'ratio'])
+
+        systems = {'a': np.array([]), 'b': np.array([1.0, 2.0]), 'c': np.array([])}
+        result = detector.detect_resonances_in_system(systems, n_jobs=3)
+        self.assertEqual(result['system'].tolist(), ['b'])
+        self.assertEqual(result[['p1', 'p2', 'ratio']].values.tolist(), [[1.0, 2.0, 2.0]])
+
+    def test_detect_resonances_in_system_block_boundaries(self):
+        # Each system has a distinct 2:1 pair, so every row identifies its owner.
+        systems = {f"star{i}": np.array([1.0, 2.0]) * (i + 1) for i in range(7)}
+        for n_jobs in (1, 2, 3, 4):
+            result = detector.detect_resonances_in_system(systems, n_jobs=n_jobs)
+            self.assertEqual(result['system'].tolist(), list(systems))
+            np.testing.assert_allclose(result['p1'], np.arange(1, 8))
@@ -0,0 +1,16 @@
+import unittest
+from resonanceX import simulator
+import numpy as np
+
+class TestSimulator(unittest.TestCase):
+    def test_simulate_orbits_shape(self):
+        positions = simulator.simulate_orbits([10.0, 20.0], [1e-5, 1e-5], duration=50, steps=40)
+        self.assertIsInstance(positions, np.ndarray)
+        self.assertEqual(positions.shape, (2, 40, 2))
+        self.assertEqual(positions.dtype, np.float64)
+        self.assertTrue(np.isfinite(positions).all())
+
+    def test_simulate_orbits_invalid_periods(self):
+        positions = simulator.simulate_orbits([10.0, -1.0], [1e-5, 1e-5], duration=50, steps=40)
+        self.assertEqual(positions.shape, (2, 0, 2))
+        self.assertEqual(positions.size, 0)
@@ -0,0 +1,24 @@
+import io
+import unittest
+from resonanceX import utils
+import pandas as pd
+
+CSV = b"""rowid,hostname,pl_letter,pl_orbper,discoverymethod,pl_rade
+1,Kepler-2,b,3.5,Transit,1.1
+2,Alpha,b,,Radial Velocity,
+3,Alpha,c,12.0,Radial Velocity,2.0
+4,Kepler-2,c,7.0,Transit,1.3
+"""
+
+class TestUtils(unittest.TestCase):
+    def test_load_exoplanet_data_upload(self):
+        # A file-like upload is read twice (header probe, then data), so it must be rewound.
+        df = utils.load_exoplanet_data(io.BytesIO(CSV))
+
+        # Only USECOLS survive; disc_year and pl_bmassj are absent from the file.
+        self.assertEqual(list(df.columns), ['hostname', 'pl_letter', 'pl_orbper', 'discoverymethod'])
+        self.assertEqual(len(df), 3)
+        self.assertFalse(df['pl_orbper'].isna().any())
+        for col in ('hostname', 'discoverymethod', 'pl_letter'):
+            self.assertIsInstance(df[col].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(df['hostname'].cat.categories), ['Alpha', 'Kepler-2'])
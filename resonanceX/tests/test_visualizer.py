@@ -0,0 +1,24 @@
+import unittest
+from resonanceX import visualizer
+import numpy as np
+
+class TestVisualizer(unittest.TestCase):
+    def setUp(self):
+        t = np.linspace(0, 2 * np.pi, 1000)
+        self.positions = np.stack([
+            np.column_stack([r * np.cos(t), r * np.sin(t)]) for r in (1.0, 2.0, 3.0)
+        ])
+
+    def test_create_orbit_animation_frames(self):
+        fig = visualizer.create_orbit_animation(self.positions, ['b', 'c', 'd'], max_frames=200)
+        self.assertLessEqual(len(fig.frames), 200)
+        self.assertEqual([int(f.name) for f in fig.frames], list(range(0, 1000, 5)))
+
+    def test_create_orbit_animation_trace_layout(self):
+        for show_trails in (True, False):
+            fig = visualizer.create_orbit_animation(self.positions, ['b', 'c', 'd'],
+                                                    show_trails=show_trails, max_frames=50)
+            layout = [(t.name, t.mode) for t in fig.data]
+            self.assertEqual(len(layout), 1 + 3 * (2 if show_trails else 1))
+            for frame in fig.frames:
+                self.assertEqual([(t.name, t.mode) for t in frame.data], layout)
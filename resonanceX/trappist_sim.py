@@ -8,17 +8,16 @@ G = 1.0  # normalized gravitational constant
 def n_body_equations(t, y, masses):
     N = len(masses)
     positions = y[:3*N].reshape(N, 3)
-    velocities = y[3*N:].reshape(N, 3)
-    accelerations = np.zeros((N, 3))
+    velocities = y[3*N:]
 
-    for i in range(N):
-        for j in range(N):
-            if i != j:
-                r = positions[j] - positions[i]
-                dist = np.linalg.norm(r)
-                accelerations[i] += G * masses[j] * r / dist**3
+    # All pairwise separations r[i, j] = x_j - x_i in one (N, N, 3) broadcast;
+    # the infinite diagonal zeroes the self-interaction terms.
+    r = positions[None, :, :] - positions[:, None, :]
+    r2 = np.einsum('ijk,ijk->ij', r, r)
+    np.fill_diagonal(r2, np.inf)
+    accelerations = G * np.einsum('ijk,ij->ik', r, masses * r2**-1.5)
 
-    dydt = np.concatenate([velocities.flatten(), accelerations.flatten()])
+    dydt = np.concatenate([velocities, accelerations.ravel()])
     return dydt
 
 def simulate_trappist1():
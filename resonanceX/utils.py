@@ -1,7 +1,19 @@
 import pandas as pd
 
+# Columns the app and detectors actually use; everything else in the
+# NASA Exoplanet Archive export is skipped at parse time.
+USECOLS = ['hostname', 'pl_letter', 'pl_orbper', 'discoverymethod', 'disc_year', 'pl_bmassj']
+
 def load_exoplanet_data(path):
-    df = pd.read_csv(path)
+    header = pd.read_csv(path, nrows=0).columns
+    if hasattr(path, 'seek'):
+        path.seek(0)
+    df = pd.read_csv(path, engine='pyarrow', usecols=[c for c in USECOLS if c in header])
     df = df[df['pl_orbper'].notnull()]
     df['pl_orbper'] = pd.to_numeric(df['pl_orbper'], errors='coerce')
-    return df
\ No newline at end of file
+    # Repeated labels become integer-coded categoricals, so groupby and
+    # value_counts work on codes instead of hashing strings.
+    for col in ('hostname', 'discoverymethod', 'pl_letter'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
@@ -1,100 +1,88 @@
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 import numpy as np
 
-def create_orbit_animation(positions, planet_labels, dynamic_scaling=True, show_trails=True, trail_length=30):
+def create_orbit_animation(positions, planet_labels, dynamic_scaling=True, show_trails=True, trail_length=30,
+                           max_frames=200):
     """
     Creates a 3D animated orbit visualization using Plotly.
 
     Args:
-        positions (list of list of (x, y)): Planet trajectories.
+        positions (array-like of shape (n_planets, steps, 2)): Planet (x, y) trajectories.
         planet_labels (list of str): Labels for each planet.
         dynamic_scaling (bool): Whether to auto-scale the plot.
         show_trails (bool): Whether to show orbit trails.
-        trail_length (int): Number of past positions to show in trail.
+        trail_length (int): Number of past frames to show in trail.
+        max_frames (int): Maximum number of animation frames; longer
+            trajectories are thinned by strided sampling.
 
     Returns:
         plotly.graph_objects.Figure: The animated orbit figure.
     """
-    inclinations = np.linspace(0, 0.2, len(positions))
     min_len = min(len(orbit) for orbit in positions)
+    pos = np.array([np.asarray(orbit, dtype=float)[:min_len] for orbit in positions])
+    inclinations = np.linspace(0, 0.2, len(pos))
+    xs, ys = pos[:, :, 0], pos[:, :, 1]
+    zs = ys * np.sin(inclinations)[:, None]
 
     if dynamic_scaling:
-        max_radius = max(np.max([np.linalg.norm(pos) for pos in orbit]) for orbit in positions)
-        scale = max_radius * 1.5
+        scale = np.linalg.norm(pos, axis=-1).max() * 1.5
     else:
         scale = 5
 
-    x_history = [[] for _ in range(len(positions))]
-    y_history = [[] for _ in range(len(positions))]
-    z_history = [[] for _ in range(len(positions))]
+    colors = [tuple(int(c) for c in np.clip((50 + i * 20, 100 + i * 10, 200 - i * 15), 0, 255))
+              for i in range(len(pos))]
 
-    frames = []
-    for frame in range(min_len):
-        data = [go.Scatter3d(
+    def star_trace():
+        return go.Scatter3d(
             x=[0], y=[0], z=[0],
             mode='markers',
             marker=dict(size=12, color='gold', opacity=0.8),
             name='Star'
-        )]
-        for i, orbit in enumerate(positions):
-            x, y = orbit[frame]
-            z = y * np.sin(inclinations[i])
-            x_history[i].append(x)
-            y_history[i].append(y)
-            z_history[i].append(z)
-            x_history[i] = x_history[i][-trail_length:]
-            y_history[i] = y_history[i][-trail_length:]
-            z_history[i] = z_history[i][-trail_length:]
-
-            label = planet_labels[i] if i < 2 else None
-            base_color = (50 + i * 20, 100 + i * 10, 200 - i * 15)
-            color = f'rgb{base_color}'
-
-            data.append(go.Scatter3d(
-                x=[x], y=[y], z=[z],
-                mode='markers+text' if label else 'markers',
-                marker=dict(size=10, color=color),
-                text=[label] if label else None,
-                textposition="top center",
-                name=label or f'Planet {i+1}'
-            ))
-
-            if show_trails and len(x_history[i]) > 1:
-                for j in range(1, len(x_history[i])):
-                    fade = j / len(x_history[i])
-                    segment_color = f'rgba({base_color[0]}, {base_color[1]}, {base_color[2]}, {fade:.2f})'
-                    data.append(go.Scatter3d(
-                        x=[x_history[i][j-1], x_history[i][j]],
-                        y=[y_history[i][j-1], y_history[i][j]],
-                        z=[z_history[i][j-1], z_history[i][j]],
-                        mode='lines',
-                        line=dict(color=segment_color, width=2),
-                        showlegend=False
-                    ))
-
-        frames.append(go.Frame(data=data, name=str(frame)))
-
-    init_data = [go.Scatter3d(
-        x=[0], y=[0], z=[0],
-        mode='markers',
-        marker=dict(size=12, color='gold', opacity=0.8),
-        name='Star'
-    )]
-    for i, orbit in enumerate(positions):
-        x, y = orbit[0]
-        z = y * np.sin(inclinations[i])
+        )
+
+    def planet_trace(i, step):
         label = planet_labels[i] if i < 2 else None
-        color = f'rgb({50 + i * 20}, {100 + i * 10}, {200 - i * 15})'
-        init_data.append(go.Scatter3d(
-            x=[x], y=[y], z=[z],
+        return go.Scatter3d(
+            x=[xs[i, step]], y=[ys[i, step]], z=[zs[i, step]],
             mode='markers+text' if label else 'markers',
-            marker=dict(size=10, color=color),
+            marker=dict(size=10, color=f'rgb{colors[i]}'),
             text=[label] if label else None,
             textposition="top center",
             name=label or f'Planet {i+1}'
-        ))
+        )
+
+    def trail_trace(i, steps):
+        # One trace per trail; the fade is a per-vertex colour ramp.
+        r, g, b = colors[i]
+        return go.Scatter3d(
+            x=xs[i, steps], y=ys[i, steps], z=zs[i, steps],
+            mode='lines',
+            line=dict(
+                color=np.arange(len(steps)) / len(steps),
+                colorscale=[[0, f'rgba({r}, {g}, {b}, 0)'], [1, f'rgba({r}, {g}, {b}, 1)']],
+                cmin=0, cmax=1, width=2
+            ),
+            showlegend=False
+        )
+
+    def frame_data(k):
+        # Plotly matches frame.data[i] to figure trace i, so every frame and the
+        # initial figure share the layout [star, planet_0, trail_0, planet_1, ...].
+        step = frame_steps[k]
+        trail = frame_steps[max(0, k - trail_length + 1):k + 1]
+        data = [star_trace()]
+        for i in range(len(pos)):
+            data.append(planet_trace(i, step))
+            if show_trails:
+                data.append(trail_trace(i, trail))
+        return data
+
+    stride = max(1, -(-min_len // max_frames))
+    frame_steps = np.arange(0, min_len, stride)
+
+    frames = [go.Frame(data=frame_data(k), name=str(step)) for k, step in enumerate(frame_steps)]
+    init_data = frame_data(0)
 
     layout = go.Layout(
         scene=dict(
@@ -129,19 +117,52 @@ def plot_resonances(pairs):
     Returns:
         matplotlib.figure.Figure: The generated resonance plot.
     """
+    pairs = np.asarray(pairs, dtype=float).reshape(-1, 3)
+    colors = plt.get_cmap('viridis', len(pairs))(np.arange(len(pairs)))
     fig, ax = plt.subplots(figsize=(8, 6))
-    cmap = cm.get_cmap('viridis', len(pairs))
 
-    for i, (p1, p2, ratio) in enumerate(pairs):
-        ax.plot([0, 1], [p1, p2], marker='o', color=cmap(i), linewidth=2)
-        ax.text(0.5, (p1 + p2) / 2, f"{ratio}:1", fontsize=10,
-                ha='center', va='bottom', color=cmap(i))
+    # One plot call for every pair: each column of y is a separate line.
+    ax.set_prop_cycle(color=colors)
+    ax.plot([0, 1], pairs[:, :2].T, marker='o', linewidth=2)
+    for (p1, p2, ratio), color in zip(pairs, colors):
+        ax.text(0.5, (p1 + p2) / 2, f"{ratio:.2f}:1", fontsize=10,
+                ha='center', va='bottom', color=color)
 
     ax.set_ylabel("Orbital Period (days)")
     ax.set_xticks([])
     ax.set_title("Detected Resonances Between Planet Pairs")
     ax.grid(True, linestyle='--', alpha=0.5)
-    ax.legend([f"{p1:.2f}:{p2:.2f} ~ {ratio}:1" for p1, p2, ratio in pairs],
+    ax.legend([f"{p1:.2f}:{p2:.2f} ~ {ratio:.2f}:1" for p1, p2, ratio in pairs],
               loc='upper right', fontsize=8)
     fig.tight_layout()
     return fig
+
+
+def plot_resonances_plotly(pairs):
+    """
+    Plots orbital period resonances between planet pairs using Plotly.
+
+    Args:
+        pairs (array-like of shape (n_pairs, 3)): Rows of (p1, p2, ratio),
+            where p1 and p2 are orbital periods and ratio is the approximate resonance.
+
+    Returns:
+        plotly.graph_objects.Figure: Scatter of p2 against p1, one marker per pair.
+    """
+    pairs = np.asarray(pairs, dtype=float).reshape(-1, 3)
+    p1, p2, ratio = pairs.T
+
+    fig = go.Figure(go.Scattergl(
+        x=p1, y=p2,
+        mode='markers',
+        marker=dict(size=7, color=ratio, colorscale='Viridis', showscale=True,
+                    colorbar=dict(title='Ratio')),
+        hovertemplate="%{x:.2f} vs %{y:.2f} days<br>~ %{marker.color:.2f}:1<extra></extra>"
+    ))
+    fig.update_layout(
+        title="Detected Resonances Between Planet Pairs",
+        xaxis=dict(title="Inner Period (days)", type='log'),
+        yaxis=dict(title="Outer Period (days)", type='log'),
+        margin=dict(l=0, r=0, b=0, t=30)
+    )
+    return fig
@@ -14,12 +14,12 @@ results = detect_resonances_in_system(df, tolerance)
 # Print summary
 print(f"Total systems analyzed: {df['hostname'].nunique()}")
 print(f"Resonant pairs found: {len(results)}")
-for system, p1, p2, ratio in results[:10]:  # Show first 10
-    print(f"{system}: {p1:.2f} vs {p2:.2f} ~ {ratio}:1")
+for system, p1, p2, ratio in results.head(10).itertuples(index=False):  # Show first 10
+    print(f"{system}: {p1:.2f} vs {p2:.2f} ~ {ratio:.2f}:1")
 
 # Visualize
-if results:
-    fig = plot_resonances([(p1, p2, ratio) for _, p1, p2, ratio in results])
+if not results.empty:
+    fig = plot_resonances(list(results[['p1', 'p2', 'ratio']].itertuples(index=False, name=None)))
     plt.show()
 else:
     print("No resonances detected.")
\ No newline at end of file